@@ -6,6 +6,7 @@
 #           Jan 2018, SUAVE Team
 #           May 2019, T. MacDonald
 #           Mar 2020, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #   Imports
@@ -15,9 +16,18 @@ import matplotlib.pyplot as plt
 import matplotlib
 matplotlib.use('Agg')
 
+import sys, os, io, traceback, time, argparse, functools, json, csv
+import tempfile, faulthandler, subprocess
+import multiprocessing
+from multiprocessing.connection import wait
+
 import SUAVE
 from SUAVE.Core.DataOrdered import DataOrdered
-import sys, os, traceback, time
+
+try:
+    import resource
+except ImportError:
+    resource = None
 
 
 # ----------------------------------------------------------------------
@@ -29,6 +39,31 @@ import sys, os, traceback, time
 # this automatic regression script.
 #
 # For more information, see ../templates/example_test_script.py
+#
+# By default the modules are run one after another in this interpreter.
+# With "--jobs N" each module is run in its own freshly spawned worker
+# process (own working directory, own sys.path, Agg backend), N at a time.
+# The output of each module is printed as a block once it finishes, also
+# when its worker crashes. The numpy thread pools of the workers are
+# limited to cores/N threads unless OMP_NUM_THREADS, OPENBLAS_NUM_THREADS
+# or MKL_NUM_THREADS are already set.
+#
+#   $ python automatic_regression.py --jobs 8
+#
+# "--report FILE" writes the wall time, cpu time, peak memory and time
+# spent in mission.evaluate() of every module to FILE (.json or .csv). So
+# that these are per module, "--report" and "--compare" always run the
+# modules in isolated workers, also with "--jobs 1". The report also has an
+# "import SUAVE" entry, the wall time of a clean "import SUAVE" in a fresh
+# interpreter (best of 3), measured before any worker starts. A json report
+# can later be given to "--compare", modules (and the import) that got
+# slower than the baseline by more than "--threshold" (relative) and
+# "--min-difference" (seconds) are flagged and make the regression fail.
+# The baseline has to be measured with the same number of jobs, as workers
+# compete for cores.
+#
+#   $ python automatic_regression.py --jobs 8 --report baseline.json
+#   $ python automatic_regression.py --jobs 8 --compare baseline.json
 
 # ----------------------------------------------------------------------
 #   The Modules to Test
@@ -64,6 +99,7 @@ modules = [
     'scripts/geometry/NACA_volume_compute.py',
     'scripts/geometry/wing_fuel_volume_compute.py',
     'scripts/geometry/fuselage_planform_compute.py',
+    'scripts/import_time/import_time.py',
     'scripts/industrial_costs/industrial_costs.py',
     'scripts/internal_combustion_propeller/ICE_Test.py',
     'scripts/internal_combustion_propeller/ICE_CS_Test.py',
@@ -113,6 +149,8 @@ modules = [
 
 def main():
 
+    args = parse_arguments()
+
     # preallocate test results
     results = DataOrdered()
     for module in modules:
@@ -124,33 +162,298 @@ def main():
     sys.stdout.write('# --------------------------------------------------------------------- \n')
     sys.stdout.write(' \n')
 
+    # load the baseline timings
+    baseline = None
+    if args.compare:
+        baseline, baseline_jobs = load_report(args.compare)
+        if baseline_jobs != args.jobs:
+            sys.stderr.write('Baseline %s was measured with --jobs %s, this run uses --jobs %i. '
+                             'Wall times are only comparable with the same number of jobs.\n'
+                             % (args.compare,baseline_jobs,args.jobs))
+            sys.exit(1)
+
+    # only time the mission evaluations when the timings are used
+    timed = bool(args.report or args.compare)
+
+    # import time, before the workers compete for the cores
+    if timed:
+        import_time = measure_import_time()
+        sys.stdout.write('# SUAVE import time: %.2f s \n\n' % import_time)
+
     # run tests
+    if args.jobs > 1 or timed:
+        # start the slowest modules first so they don't end up last
+        ordered = list(modules)
+        if baseline:
+            ordered.sort(key=lambda module: -baseline.get(module,{}).get('wall_time',0.))
+        outcomes = run_parallel(ordered,args.jobs,timed)
+    else:
+        outcomes = run_serial(modules)
+
     all_pass = True
-    for module in modules:
-        passed = test_module(module)
-        if passed:
+    records  = DataOrdered()
+    for record in outcomes:
+        module = record['module']
+        records[module] = record
+        if record['passed']:
             results[module] = '  Passed'
         else:
             results[module] = '* FAILED'
             all_pass = False
 
+    records = [ records[module] for module in modules if module in records ]
+    if timed:
+        records.append( dict(module='import SUAVE',passed=True,wall_time=import_time) )
+
     # final report
     sys.stdout.write('# --------------------------------------------------------------------- \n')
     sys.stdout.write('Final Results \n')
     for module,result in list(results.items()):
         sys.stdout.write('%s - %s\n' % (result,module))
 
+    # timing report
+    if args.report:
+        write_report(args.report,records,args.jobs)
+        sys.stdout.write('\nTiming report written to %s \n' % args.report)
+
+    if baseline:
+        slower = compare_report(records,baseline,args.threshold,args.min_difference)
+        sys.stdout.write('# --------------------------------------------------------------------- \n')
+        sys.stdout.write('Performance Comparison (threshold %.0f%%, at least %.2f s) \n' % (args.threshold*100.,args.min_difference))
+        if not slower:
+            sys.stdout.write('  No slowdowns against %s\n' % args.compare)
+        for module,field,old,new in slower:
+            sys.stdout.write('* SLOWER - %s - %s %.2f s -> %.2f s (%+.0f%%)\n' % (module,field,old,new,(new/old-1.)*100.))
+        all_pass = all_pass and not slower
+
     if all_pass:
         sys.exit(0)
     else:
         sys.exit(1)
 
 
+def parse_arguments():
+    """ reads the command line, unknown arguments (e.g. "test") are ignored """
+
+    parser = argparse.ArgumentParser(description='SUAVE Automatic Regression')
+    parser.add_argument('-j','--jobs', type=int, default=1,
+                        help='number of worker processes (at least 1), 1 runs serially in this interpreter')
+    parser.add_argument('--report', default=None,
+                        help='write per module timings to a .json or .csv file, '
+                             'runs the modules in isolated workers')
+    parser.add_argument('--compare', default=None,
+                        help='json report to compare timings against, measured with the same --jobs')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='relative slowdown flagged by --compare, the slowdown also '
+                             'has to exceed --min-difference')
+    parser.add_argument('--min-difference', type=float, default=0.25,
+                        help='slowdowns below this many seconds are treated as noise by --compare')
+
+    args, _ = parser.parse_known_args()
+
+    if args.jobs < 1:
+        parser.error('--jobs must be at least 1')
+
+    return args
+
+
+# ----------------------------------------------------------------------
+#   Test Runners
+# ----------------------------------------------------------------------
+
+def run_serial(module_paths):
+    """ runs each module in this interpreter, one after another """
+
+    for module in module_paths:
+        record = test_module(module,isolated=False)
+        yield record
+
+
+def run_parallel(module_paths,jobs,timed=False):
+    """ runs each module in its own spawned worker process, results are
+        yielded in order of completion, a worker that dies without
+        reporting (segfault, out of memory, os._exit) fails its module
+    """
+
+    # the workers inherit the backend through the environment
+    os.environ['MPLBACKEND'] = 'Agg'
+
+    # share the cores between the workers' numpy thread pools instead of
+    # every worker starting one thread per core, unless set by the user
+    threads = str(max(1,multiprocessing.cpu_count()//jobs))
+    for variable in ['OMP_NUM_THREADS','OPENBLAS_NUM_THREADS','MKL_NUM_THREADS']:
+        os.environ.setdefault(variable,threads)
+
+    # spawn so that every module starts from a clean interpreter, one
+    # process per module so that no state leaks from one to the next
+    context = multiprocessing.get_context('spawn')
+
+    home_dir = os.getcwd()
+    pending  = list(module_paths)
+    running  = dict()
+
+    try:
+        while pending or running:
+
+            # keep the workers busy
+            while pending and len(running) < jobs:
+                module         = pending.pop(0)
+                log, log_path  = tempfile.mkstemp(prefix='suave_regression_',suffix='.log')
+                os.close(log)
+                reader, writer = context.Pipe(duplex=False)
+                process        = context.Process(target=test_module_isolated,
+                                                 args=((module,home_dir,timed,log_path),writer))
+                process.start()
+                writer.close()
+                running[module] = dict(process=process,reader=reader,result=None,
+                                       log_path=log_path,tic=time.time())
+
+            # wait for results and for workers that exit without one
+            waiting = dict()
+            for module, job in running.items():
+                waiting[job['process'].sentinel] = module
+                if job['reader'] is not None:
+                    waiting[job['reader']] = module
+
+            for ready in wait(list(waiting.keys())):
+                module = waiting[ready]
+                if module not in running:
+                    continue
+                job    = running[module]
+
+                if ready is job['reader']:
+                    receive_result(job)
+                    continue
+
+                # the worker has exited
+                if job['reader'] is not None and job['reader'].poll():
+                    receive_result(job)
+                if job['reader'] is not None:
+                    job['reader'].close()
+                job['process'].join()
+                del running[module]
+
+                log = read_log(job['log_path'])
+
+                if job['result'] is None:
+                    record, log = worker_failure(module,job['process'].exitcode,time.time()-job['tic'],log)
+                else:
+                    record = job['result']
+
+                sys.stdout.write(log)
+                sys.stdout.flush()
+                yield record
+
+    finally:
+        for job in running.values():
+            job['process'].terminate()
+            job['process'].join()
+            read_log(job['log_path'])
+
+
+def read_log(log_path):
+    """ returns and removes the log file of a worker """
+
+    try:
+        with open(log_path,errors='replace') as log_file:
+            log = log_file.read()
+        os.remove(log_path)
+    except OSError:
+        log = ''
+
+    return log
+
+
+def receive_result(job):
+    """ reads the record a worker sends once before it exits """
+
+    try:
+        job['result'] = job['reader'].recv()
+    except EOFError:
+        pass
+    job['reader'].close()
+    job['reader'] = None
+
+
+def worker_failure(module_path,exitcode,duration,output):
+    """ record and log for a worker that exited without reporting, output
+        is whatever the worker wrote to its log before it died
+    """
+
+    module_name = os.path.basename(module_path)
+
+    log = io.StringIO()
+    if not output:
+        log.write('# --------------------------------------------------------------------- \n')
+        log.write('# Start Test: %s \n' % module_path)
+    log.write(output)
+    if output and not output.endswith('\n'):
+        log.write('\n')
+    log.write('Test Failed: \n')
+    log.write('Worker process exited with code %s \n' % exitcode)
+    log.write('\n')
+    log.write('# FAILED: %s \n' % module_name)
+    log.write('# Test Duration: %.4f min \n' % (duration/60) )
+    log.write('\n')
+
+    record = dict(module=module_path,passed=False,wall_time=duration,exitcode=exitcode)
+
+    return record, log.getvalue()
+
+
+def test_module_isolated(task,connection):
+    """ worker side of run_parallel(), writes the output of one module to
+        its log file and sends the record back through connection
+    """
+
+    module_path, home_dir, timed, log_path = task
+
+    # unbuffered, so that the output survives a crash of the worker, and
+    # on the file descriptors too, for output of native code
+    log = io.TextIOWrapper(open(log_path,'wb',buffering=0),write_through=True)
+    os.dup2(log.fileno(),1)
+    os.dup2(log.fileno(),2)
+    sys.stdout = sys.stderr = log
+    faulthandler.enable(file=log)
+
+    os.chdir(home_dir)
+
+    import matplotlib
+    matplotlib.use('Agg')
+
+    if timed:
+        instrument_mission_evaluate()
+
+    tic = time.time()
+
+    try:
+        record = test_module(module_path,isolated=True)
+
+    # e.g. SystemExit, which test_module() lets through
+    except BaseException:
+        duration = time.time() - tic
+        log.write( 'Test Failed: \n' )
+        log.write( traceback.format_exc() )
+        log.write( '\n' )
+        log.write( '# FAILED: %s \n' % os.path.basename(module_path) )
+        log.write( '# Test Duration: %.4f min \n' % (duration/60) )
+        log.write( '\n' )
+        record = dict(module=module_path,passed=False,wall_time=duration)
+
+    connection.send(record)
+    connection.close()
+
+    return
+
+
 # ----------------------------------------------------------------------
 #   Module Tester
 # ----------------------------------------------------------------------
 
-def test_module(module_path):
+def test_module(module_path,isolated=False):
+    """ runs the main() of one module, the peak memory and SUAVE import time
+        are only per module when isolated in a worker, otherwise None
+    """
 
     home_dir = os.getcwd()
     test_dir, module_name = os.path.split( os.path.abspath(module_path) )
@@ -159,7 +462,11 @@ def test_module(module_path):
     sys.stdout.write('# Start Test: %s \n' % module_path)
     sys.stdout.flush()
 
-    tic = time.time()
+    mission_timer['time']  = 0.
+    mission_timer['calls'] = 0
+
+    tic     = time.time()
+    cpu_tic = time.process_time()
 
     # try the test
     try:
@@ -197,9 +504,21 @@ def test_module(module_path):
         sys.stdout.write('# Passed: %s \n' % module_name)
     else:
         sys.stdout.write('# FAILED: %s \n' % module_name)
-    sys.stdout.write('# Test Duration: %.4f min \n' % ((time.time()-tic)/60) )
+    wall_time = time.time() - tic
+    cpu_time  = time.process_time() - cpu_tic
+    sys.stdout.write('# Test Duration: %.4f min \n' % (wall_time/60) )
     sys.stdout.write('\n')
 
+    record = dict(
+        module                = module_path,
+        passed                = passed,
+        wall_time             = wall_time,
+        cpu_time              = cpu_time,
+        peak_memory           = peak_memory() if isolated else None,
+        mission_evaluate_time = mission_timer['time'],
+        mission_evaluate_calls= mission_timer['calls'],
+    )
+
     # cleanup
     plt.close('all')
     os.chdir(home_dir)
@@ -208,7 +527,140 @@ def test_module(module_path):
     sys.stdout.flush()
     sys.stderr.flush()
 
-    return passed
+    return record
+
+
+# ----------------------------------------------------------------------
+#   Timing Instrumentation
+# ----------------------------------------------------------------------
+
+# time spent inside the outermost mission.evaluate() calls of one module
+mission_timer = dict(time=0.,calls=0,depth=0)
+
+def instrument_mission_evaluate():
+    """ wraps Segment.evaluate() so that the time spent in mission
+        evaluations is accumulated in mission_timer, nested segment
+        evaluations are counted as part of their parent
+    """
+
+    try:
+        from SUAVE.Analyses.Mission.Segments import Segment
+    except ImportError:
+        return
+
+    evaluate = Segment.evaluate
+    if getattr(evaluate,'timed',False):
+        return
+
+    @functools.wraps(evaluate)
+    def timed_evaluate(*args,**kwargs):
+        if mission_timer['depth']:
+            return evaluate(*args,**kwargs)
+        mission_timer['depth'] += 1
+        tic = time.time()
+        try:
+            return evaluate(*args,**kwargs)
+        finally:
+            mission_timer['time']  += time.time() - tic
+            mission_timer['calls'] += 1
+            mission_timer['depth'] -= 1
+
+    timed_evaluate.timed = True
+    Segment.evaluate = timed_evaluate
+
+
+def peak_memory():
+    """ peak resident set size of this process in MB, None where unavailable """
+
+    if resource is None:
+        return None
+
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # bytes on mac, kilobytes elsewhere
+    if sys.platform == 'darwin':
+        return rss / 1024.**2
+    return rss / 1024.
+
+
+# ----------------------------------------------------------------------
+#   Timing Reports
+# ----------------------------------------------------------------------
+
+report_fields = ['module','passed','wall_time','cpu_time','peak_memory',
+                 'mission_evaluate_time','mission_evaluate_calls','exitcode']
+
+# run in a fresh interpreter, the timer starts before anything is imported
+import_statement = 'import time; tic = time.perf_counter(); import SUAVE; print(time.perf_counter() - tic)'
+
+def measure_import_time(repeats=3):
+    """ wall time of a clean "import SUAVE" in a new interpreter, best of
+        repeats, including everything SUAVE imports (numpy, scipy, ...)
+    """
+
+    environment = dict(os.environ,MPLBACKEND='Agg')
+
+    times = []
+    for i in range(repeats):
+        output = subprocess.check_output([sys.executable,'-c',import_statement],
+                                         env=environment,universal_newlines=True)
+        times.append(float(output.split()[-1]))
+
+    return min(times)
+
+
+def write_report(filename,records,jobs):
+    """ writes the module records to a .csv or .json file """
+
+    if os.path.splitext(filename)[1].lower() == '.csv':
+        with open(filename,'w',newline='') as report:
+            writer = csv.DictWriter(report,fieldnames=report_fields,restval='')
+            writer.writeheader()
+            for record in records:
+                writer.writerow(record)
+    else:
+        report = dict(
+            date    = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime()),
+            jobs    = jobs,
+            modules = records,
+        )
+        with open(filename,'w') as report_file:
+            json.dump(report,report_file,indent=2)
+
+
+def load_report(filename):
+    """ reads a json report, returns the records keyed by module and the
+        number of jobs the report was measured with
+    """
+
+    with open(filename) as report_file:
+        report = json.load(report_file)
+
+    records = dict( (record['module'],record) for record in report['modules'] )
+
+    return records, report.get('jobs')
+
+
+def compare_report(records,baseline,threshold,min_difference):
+    """ finds the modules whose wall time or mission evaluation time grew by
+        more than threshold against the baseline, differences of less than
+        min_difference seconds are treated as noise
+    """
+
+    slower = []
+    for record in records:
+        old = baseline.get(record['module'])
+        if old is None or not record['passed'] or not old.get('passed',True):
+            continue
+        for field in ['wall_time','mission_evaluate_time']:
+            old_time = old.get(field) or 0.
+            new_time = record.get(field) or 0.
+            if old_time <= 0.:
+                continue
+            if new_time - old_time > max(threshold*old_time,min_difference):
+                slower.append( (record['module'],field,old_time,new_time) )
+
+    return slower
 
 # ----------------------------------------------------------------------
 #   Call Main
@@ -0,0 +1,51 @@
+# atmosphere_benchmark.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" times US_Standard_1976.compute_values over a growing number of points
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units
+
+import numpy as np
+
+from benchmark_tools import time_kernel
+
+# ----------------------------------------------------------------------
+#   Cases
+# ----------------------------------------------------------------------
+
+number_of_points = [16, 1000, 100000, 1000000]
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    atmosphere = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+
+    for n_points in number_of_points:
+
+        # -3 km to 90 km covers every layer of the model
+        altitude = np.linspace(-3.,90.,n_points)[:,None] * Units.km
+
+        time_kernel('atmosphere','US_Standard_1976.compute_values',
+                    lambda : atmosphere.compute_values(altitude),
+                    dict(points=n_points))
+
+        time_kernel('atmosphere','US_Standard_1976.compute_values',
+                    lambda : atmosphere.compute_values(altitude,15.),
+                    dict(points=n_points,delta_isa=15.))
+
+    return
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,171 @@
+# automatic_benchmarks.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import matplotlib
+matplotlib.use('Agg')
+
+import sys, os, traceback, time, argparse, json
+
+import benchmark_tools
+
+# ----------------------------------------------------------------------
+#   How This Works
+# ----------------------------------------------------------------------
+
+# Unlike the regression scripts, which check numbers once, the benchmarks
+# time the expensive kernels of SUAVE repeatedly (after untimed warmup
+# calls) and report min, median and spread for every case. The cases are
+# parameterised by control point and vortex counts so that the scaling of
+# each kernel can be seen. The vehicles and missions are the ones of the
+# regression scripts in ../scripts.
+#
+# Each benchmark script includes a main function, which calls
+# benchmark_tools.time_kernel() once per case. Benchmarks always run one
+# after another so they don't compete for cores.
+#
+#   $ python automatic_benchmarks.py
+#   $ python automatic_benchmarks.py vlm propeller --repeats 10
+#   $ python automatic_benchmarks.py --report benchmarks.json
+
+# ----------------------------------------------------------------------
+#   The Modules to Benchmark
+# ----------------------------------------------------------------------
+
+modules = [
+    'atmosphere_benchmark.py',
+    'data_benchmark.py',
+    'vlm_benchmark.py',
+    'propeller_benchmark.py',
+    'mission_benchmark.py',
+    'nexus_benchmark.py',
+]
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    args = parse_arguments()
+
+    benchmark_tools.settings['warmup']  = args.warmup
+    benchmark_tools.settings['repeats'] = args.repeats
+
+    selected = modules
+    if args.benchmarks:
+        selected = [ module for module in modules if benchmark_name(module) in args.benchmarks ]
+
+    sys.stdout.write('# --------------------------------------------------------------------- \n')
+    sys.stdout.write('#   SUAVE Benchmarks \n')
+    sys.stdout.write('#   %s \n' % time.strftime("%B %d, %Y - %H:%M:%S", time.gmtime()) )
+    sys.stdout.write('#   warmup %i, repeats %i \n' % (args.warmup,args.repeats) )
+    sys.stdout.write('# --------------------------------------------------------------------- \n')
+    sys.stdout.write(' \n')
+
+    all_pass = True
+    for module in selected:
+        all_pass = benchmark_module(module) and all_pass
+
+    if args.report:
+        report = dict(
+            date     = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime()),
+            warmup   = args.warmup,
+            repeats  = args.repeats,
+            kernels  = benchmark_tools.records,
+        )
+        with open(args.report,'w') as report_file:
+            json.dump(report,report_file,indent=2)
+        sys.stdout.write('Benchmark report written to %s \n' % args.report)
+
+    if all_pass:
+        sys.exit(0)
+    else:
+        sys.exit(1)
+
+
+def parse_arguments():
+
+    parser = argparse.ArgumentParser(description='SUAVE Benchmarks')
+    parser.add_argument('benchmarks', nargs='*',
+                        help='benchmarks to run, e.g. vlm propeller, default all')
+    parser.add_argument('--warmup', type=int, default=1,
+                        help='untimed calls before timing each case')
+    parser.add_argument('--repeats', type=int, default=5,
+                        help='timed calls of each case')
+    parser.add_argument('--report', default=None,
+                        help='write all timings to a .json file')
+
+    args = parser.parse_args()
+
+    names   = [ benchmark_name(module) for module in modules ]
+    unknown = [ name for name in args.benchmarks if name not in names ]
+    if unknown:
+        parser.error('unknown benchmark %s, choose from %s' % (', '.join(unknown),', '.join(names)))
+
+    return args
+
+
+def benchmark_name(module_path):
+    """ e.g. 'vlm' for 'vlm_benchmark.py' """
+    return os.path.basename(module_path).split('_benchmark')[0]
+
+
+# ----------------------------------------------------------------------
+#   Module Benchmark
+# ----------------------------------------------------------------------
+
+def benchmark_module(module_path):
+
+    home_dir = os.getcwd()
+    bench_dir, module_name = os.path.split( os.path.join(os.path.dirname(os.path.abspath(__file__)),module_path) )
+
+    sys.stdout.write('# --------------------------------------------------------------------- \n')
+    sys.stdout.write('# Start Benchmark: %s \n' % module_path)
+    sys.stdout.flush()
+
+    tic = time.time()
+
+    try:
+        os.chdir(bench_dir)
+        if bench_dir not in sys.path:
+            sys.path.append(bench_dir)
+
+        name   = os.path.splitext(module_name)[0]
+        module = __import__(name)
+        module.main()
+
+        passed = True
+
+    except Exception as exc:
+
+        sys.stderr.write( 'Benchmark Failed: \n' )
+        sys.stderr.write( traceback.format_exc() )
+        sys.stderr.write( '\n' )
+        sys.stderr.flush()
+
+        passed = False
+
+    if not passed:
+        sys.stdout.write('# FAILED: %s \n' % module_name)
+    sys.stdout.write('# Benchmark Duration: %.4f min \n' % ((time.time()-tic)/60) )
+    sys.stdout.write('\n')
+
+    os.chdir(home_dir)
+
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+    return passed
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
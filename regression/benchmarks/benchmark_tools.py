@@ -0,0 +1,97 @@
+# benchmark_tools.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" shared timing helpers for the SUAVE performance benchmarks
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import sys, time, functools
+import numpy as np
+
+# ----------------------------------------------------------------------
+#   Settings
+# ----------------------------------------------------------------------
+
+# changed by automatic_benchmarks.py from the command line
+settings = dict(
+    warmup  = 1,
+    repeats = 5,
+)
+
+# records of every kernel timed in this process
+records = []
+
+# ----------------------------------------------------------------------
+#   Timing
+# ----------------------------------------------------------------------
+
+def time_kernel(benchmark,kernel,function,parameters=None,setup=None,warmup=None,repeats=None):
+    """ times function() repeatedly after some untimed warmup calls
+
+        Inputs:
+            benchmark  - name of the benchmark script
+            kernel     - name of the timed kernel
+            function   - callable without arguments, or taking the
+                         output of setup when setup is given
+            parameters - dict of the case parameters, e.g. control points
+            setup      - untimed callable run before every call, for
+                         kernels that change their inputs (e.g. a mission
+                         starting from its converged unknowns)
+
+        Outputs:
+            record     - dict with min, median, mean and std of the wall time [s]
+    """
+
+    if parameters is None:
+        parameters = dict()
+    if warmup is None:
+        warmup = settings['warmup']
+    if repeats is None:
+        repeats = settings['repeats']
+
+    if setup is None:
+        call = lambda : function
+    else:
+        call = lambda : functools.partial(function,setup())
+
+    for i in range(warmup):
+        call()()
+
+    times = np.zeros(repeats)
+    for i in range(repeats):
+        run = call()
+        tic = time.perf_counter()
+        run()
+        times[i] = time.perf_counter() - tic
+
+    record = dict(
+        benchmark  = benchmark,
+        kernel     = kernel,
+        parameters = dict(parameters),
+        repeats    = repeats,
+        min        = float(np.min(times)),
+        median     = float(np.median(times)),
+        mean       = float(np.mean(times)),
+        std        = float(np.std(times)),
+    )
+
+    records.append(record)
+    print_record(record)
+
+    return record
+
+
+def print_record(record):
+    """ prints one line per timed case """
+
+    parameters = ', '.join( '%s=%s' % (key,value) for key,value in record['parameters'].items() )
+
+    sys.stdout.write('%-34s %-40s min %10.4f ms  median %10.4f ms  std %9.4f ms\n' % (
+        record['kernel'], parameters,
+        record['min']*1000., record['median']*1000., record['std']*1000.))
+    sys.stdout.flush()
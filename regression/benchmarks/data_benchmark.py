@@ -0,0 +1,96 @@
+# data_benchmark.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" times the nested attribute access on mission conditions that the
+    residual evaluations do at every iteration of the segment solver, and
+    how the cost of a Data lookup grows with the nesting depth
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data
+
+import numpy as np
+
+from benchmark_tools import time_kernel
+
+# ----------------------------------------------------------------------
+#   Cases
+# ----------------------------------------------------------------------
+
+# levels of Data between the root and the array
+nesting_depths = [1, 2, 4, 8]
+
+# accesses per timed call
+accesses = 10000
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    # the lookups of the solver loop, the cost doesn't depend on the
+    # length of the arrays so one control point count is enough
+    state = SUAVE.Analyses.Mission.Segments.Conditions.State()
+    state.conditions = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
+    state.expand_rows(16)
+
+    time_kernel('data','Data conditions get',
+                lambda : read_conditions(state),
+                dict(accesses=accesses))
+
+    time_kernel('data','Data conditions set',
+                lambda : write_conditions(state),
+                dict(accesses=accesses))
+
+    for depth in nesting_depths:
+        root = nested_data(depth)
+        time_kernel('data','Data nested get',
+                    lambda : read_nested(root,depth),
+                    dict(depth=depth,accesses=accesses))
+
+    return
+
+
+def read_conditions(state):
+    for i in range(accesses):
+        state.conditions.freestream.density
+        state.conditions.propulsion.throttle
+        state.conditions.aerodynamics.angle_of_attack
+    return
+
+
+def write_conditions(state):
+    density = state.conditions.freestream.density
+    for i in range(accesses):
+        state.conditions.freestream.density = density
+    return
+
+
+def nested_data(depth):
+    root = Data()
+    node = root
+    for level in range(depth-1):
+        node.child = Data()
+        node = node.child
+    node.value = np.zeros((16,1))
+    return root
+
+
+def read_nested(root,depth):
+    for i in range(accesses):
+        node = root
+        for level in range(depth-1):
+            node = node.child
+        node.value
+    return
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+# mission_benchmark.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" times a full Sequential_Segments evaluation of the B737 mission for a
+    range of control point counts, and the packing and unpacking of the
+    segment unknowns and residuals that the segment solver does on every
+    residual call
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import copy
+import sys
+
+sys.path.append('../scripts/Vehicles')
+sys.path.append('../scripts/B737')
+from mission_B737 import full_setup, simple_sizing
+
+from benchmark_tools import time_kernel
+
+# ----------------------------------------------------------------------
+#   Cases
+# ----------------------------------------------------------------------
+
+control_points = [4, 8, 16, 32]
+
+# pack or unpack calls per timed call
+pack_calls = 1000
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    configs, analyses = full_setup()
+
+    simple_sizing(configs, analyses)
+    configs.finalize()
+    analyses.finalize()
+
+    mission = analyses.missions.base
+
+    for n_cp in control_points:
+        for segment in mission.segments:
+            segment.state.numerics.number_control_points = n_cp
+
+        # every evaluation starts from a fresh copy, otherwise the
+        # repeats would start from the previously converged unknowns
+        time_kernel('mission','Sequential_Segments.evaluate',
+                    lambda mission_copy : mission_copy.evaluate(),
+                    dict(control_points=n_cp,segments=len(mission.segments)),
+                    setup = lambda : copy.deepcopy(mission))
+
+        # the unknowns and residuals are only expanded to the control
+        # points by an evaluation
+        converged = copy.deepcopy(mission)
+        converged.evaluate()
+        segment   = list(converged.segments.values())[0]
+        unknowns  = segment.state.unknowns
+        residuals = segment.state.residuals
+        x         = unknowns.pack_array()
+
+        time_kernel('mission','unknowns.pack_array',
+                    lambda : repeat(unknowns.pack_array),
+                    dict(control_points=n_cp,calls=pack_calls,unknowns=len(x)))
+
+        time_kernel('mission','unknowns.unpack_array',
+                    lambda : repeat(unknowns.unpack_array,x),
+                    dict(control_points=n_cp,calls=pack_calls,unknowns=len(x)))
+
+        time_kernel('mission','residuals.pack_array',
+                    lambda : repeat(residuals.pack_array),
+                    dict(control_points=n_cp,calls=pack_calls,unknowns=len(x)))
+
+    return
+
+
+def repeat(function,*args):
+    for i in range(pack_calls):
+        function(*args)
+    return
+
+
+if __name__ == '__main__':
+    main()
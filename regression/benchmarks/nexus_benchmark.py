@@ -0,0 +1,56 @@
+# nexus_benchmark.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" times Nexus.objective on the regional jet optimization problem, i.e.
+    one full pass through the sizing, weights, mission and post processing
+    procedure
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+import copy
+import sys
+
+sys.path.append('../scripts/Vehicles')
+sys.path.append('../scripts/Regional_Jet_Optimization')
+from Optimize2 import setup
+
+from benchmark_tools import time_kernel
+
+# ----------------------------------------------------------------------
+#   Cases
+# ----------------------------------------------------------------------
+
+control_points = [4, 8, 16]
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    problem = setup()
+    problem.hard_bounded_inputs = True
+
+    for n_cp in control_points:
+        for segment in problem.missions.base.segments:
+            segment.state.numerics.number_control_points = n_cp
+
+        # every evaluation starts from a fresh copy, otherwise the repeats
+        # would start from the previously converged unknowns (and could be
+        # short cut by an unchanged input vector)
+        time_kernel('nexus','Nexus.objective',
+                    lambda problem_copy : problem_copy.objective(np.array([1.,1.])),
+                    dict(control_points=n_cp),
+                    setup = lambda : copy.deepcopy(problem))
+
+    return
+
+
+if __name__ == '__main__':
+    main()
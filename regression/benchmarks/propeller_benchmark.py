@@ -0,0 +1,92 @@
+# propeller_benchmark.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" times Propeller.spin and generate_propeller_wake_distribution on the
+    APC 10x7 propeller for a range of control point and wake sizes
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.generate_propeller_wake_distribution import generate_propeller_wake_distribution
+
+import numpy as np
+import sys
+
+sys.path.append('../scripts/Vehicles/Propellers')
+from APC_10x7_thin_electric import propeller_geometry
+
+from benchmark_tools import time_kernel
+
+# ----------------------------------------------------------------------
+#   Cases
+# ----------------------------------------------------------------------
+
+control_points       = [1, 16, 64]
+wake_control_points  = [1, 4]
+wake_timesteps       = [20, 50, 100]
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    prop = propeller_geometry()
+    prop.origin   = np.array([[0., 0., 0.]])
+    prop.rotation = [1]
+
+    # blade element momentum solve
+    for n_cp in control_points:
+        conditions = spin_conditions(prop,n_cp)
+        time_kernel('propeller','Propeller.spin',
+                    lambda : prop.spin(conditions),
+                    dict(control_points=n_cp))
+
+    for n_cp in wake_control_points:
+
+        # the wake needs a converged spin for the induced velocities
+        conditions = spin_conditions(prop,n_cp)
+        T, Q, P, Cp, outputs, etap = prop.spin(conditions)
+        prop.outputs = outputs
+
+        for n_ts in wake_timesteps:
+            time_kernel('propeller','generate_propeller_wake_distribution',
+                        lambda : generate_propeller_wake_distribution(prop,n_cp,Data(),0.,10.,n_ts),
+                        dict(control_points=n_cp,wake_timesteps=n_ts))
+
+    return
+
+
+def spin_conditions(prop,n_cp):
+
+    atmosphere = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+    atmo_data  = atmosphere.compute_values(altitude=14000 * Units.ft)
+    ones       = np.ones((n_cp,1))
+
+    conditions = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
+    conditions.freestream.density           = atmo_data.density * ones
+    conditions.freestream.dynamic_viscosity = atmo_data.dynamic_viscosity * ones
+    conditions.freestream.speed_of_sound    = atmo_data.speed_of_sound * ones
+    conditions.freestream.temperature       = atmo_data.temperature * ones
+
+    Vv = np.linspace(10.,30.,n_cp)[:,None] * Units.mph
+
+    conditions.freestream.mach_number            = Vv / conditions.freestream.speed_of_sound
+    conditions.freestream.velocity               = Vv
+    conditions.frames.body.transform_to_inertial = np.tile(np.eye(3),(n_cp,1,1))
+    conditions.frames.inertial.velocity_vector   = np.hstack([Vv,0.*Vv,0.*Vv])
+    conditions.propulsion.throttle               = ones
+
+    prop.inputs.omega = 6500 * Units.rpm * ones
+
+    return conditions
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+# vlm_benchmark.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" times the vortex lattice solve on the B737 for a range of vortex and
+    control point counts
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.VLM import VLM
+
+import numpy as np
+import sys
+
+sys.path.append('../scripts/Vehicles')
+from Boeing_737 import vehicle_setup
+
+from benchmark_tools import time_kernel
+
+# ----------------------------------------------------------------------
+#   Cases
+# ----------------------------------------------------------------------
+
+#   [ spanwise vortices, chordwise vortices ]
+vortex_counts  = [[5,2], [10,4], [20,4], [30,8]]
+control_points = [1, 4, 16]
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    vehicle = vehicle_setup()
+
+    for n_cp in control_points:
+        conditions = vlm_conditions(n_cp)
+        for n_sw, n_cw in vortex_counts:
+            settings = vlm_settings(n_sw,n_cw)
+            time_kernel('vlm','VLM',
+                        lambda : VLM(conditions,settings,vehicle),
+                        dict(spanwise_vortices=n_sw,chordwise_vortices=n_cw,control_points=n_cp))
+
+    return
+
+
+def vlm_conditions(n_cp):
+
+    atmosphere = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+    atmo_data  = atmosphere.compute_values(altitude=10.5 * Units.km)
+
+    state = SUAVE.Analyses.Mission.Segments.Conditions.State()
+    state.conditions = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
+    state.expand_rows(n_cp)
+
+    conditions = state.conditions
+    mach       = np.linspace(0.3,0.8,n_cp)[:,None]
+
+    conditions.freestream.mach_number       = mach
+    conditions.freestream.density           = atmo_data.density * np.ones_like(mach)
+    conditions.freestream.dynamic_viscosity = atmo_data.dynamic_viscosity * np.ones_like(mach)
+    conditions.freestream.speed_of_sound    = atmo_data.speed_of_sound * np.ones_like(mach)
+    conditions.freestream.temperature       = atmo_data.temperature * np.ones_like(mach)
+    conditions.freestream.velocity          = mach * atmo_data.speed_of_sound
+    conditions.aerodynamics.angle_of_attack = np.linspace(-2.,8.,n_cp)[:,None] * Units.deg
+
+    return conditions
+
+
+def vlm_settings(n_sw,n_cw):
+
+    settings = Data()
+    settings.number_spanwise_vortices        = n_sw
+    settings.number_chordwise_vortices       = n_cw
+    settings.use_surrogate                   = False
+    settings.propeller_wake_model            = False
+    settings.model_fuselage                  = False
+    settings.spanwise_cosine_spacing         = True
+    settings.number_of_wake_timesteps        = 0.
+    settings.leading_edge_suction_multiplier = 1.
+    settings.initial_timestep_offset         = 0.
+    settings.wake_development_time           = 0.
+
+    return settings
+
+
+if __name__ == '__main__':
+    main()
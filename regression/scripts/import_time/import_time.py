@@ -0,0 +1,69 @@
+# import_time.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks the time it takes a fresh interpreter to import SUAVE against a
+    budget, the import is paid by every short lived worker process
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import subprocess
+import sys
+
+# ----------------------------------------------------------------------
+#   Budget
+# ----------------------------------------------------------------------
+
+# seconds that SUAVE may add on top of importing its third party
+# dependencies, which are timed on the same machine and so take the
+# speed of the machine out of the budget
+budget = 1.0
+
+trials = 3
+
+# each statement is timed in a new interpreter, so nothing is cached
+dependencies = 'import numpy, scipy, scipy.optimize, scipy.interpolate, matplotlib, matplotlib.pyplot'
+suave        = 'import SUAVE'
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    dependencies_time = min( time_statement(dependencies) for i in range(trials) )
+    suave_time        = min( time_statement(suave)        for i in range(trials) )
+
+    print('Import time dependencies = %.4f s' % dependencies_time)
+    print('Import time SUAVE        = %.4f s (budget %.4f s)' % (suave_time,dependencies_time+budget))
+
+    # the full attribute spelling has to keep working
+    check = 'import SUAVE; SUAVE.Analyses.Mission.Segments.Climb.Constant_Speed_Constant_Rate'
+    subprocess.check_call([sys.executable,'-c',check])
+
+    assert( suave_time < dependencies_time + budget ), 'import of SUAVE over budget'
+
+    return
+
+
+def time_statement(statement):
+    """ wall time of a statement in a new interpreter, without the start
+        up of the interpreter itself
+    """
+
+    script = ('import time\n'
+              'tic = time.perf_counter()\n'
+              '%s\n'
+              'print(time.perf_counter() - tic)\n') % statement
+
+    output = subprocess.check_output([sys.executable,'-c',script])
+
+    return float(output.decode().strip().splitlines()[-1])
+
+
+if __name__ == '__main__':
+    main()